@@ -0,0 +1,43 @@
+import json
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir))
+
+from nigga import DirectorySink, PortfolioGenerator, render_batch, write_site_index  # noqa: E402
+
+
+def write_config(path):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(PortfolioGenerator().get_default_config(), f)
+    return str(path)
+
+
+def test_batch_rejects_configs_with_the_same_output_name(tmp_path):
+    configs = [write_config(tmp_path / "a" / "x_config.json"), write_config(tmp_path / "b" / "x_config.json")]
+    with pytest.raises(ValueError, match="x: "):
+        render_batch(configs, DirectorySink(str(tmp_path / "out")))
+    assert os.listdir(tmp_path / "out") == []
+
+
+def test_batch_rejects_missing_configs(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        render_batch([str(tmp_path / "typo_config.json")], DirectorySink(str(tmp_path / "out")))
+
+
+def test_site_index_quotes_paths_and_needs_base_url_for_sitemap(tmp_path, capsys):
+    config = write_config(tmp_path / "my site_config.json")
+    sink = DirectorySink(str(tmp_path / "out"))
+    sites = render_batch([config], sink)
+
+    write_site_index(sites, sink)
+    assert not (tmp_path / "out" / "sitemap.xml").exists()
+    assert "sitemap.xml" in capsys.readouterr().err
+
+    write_site_index(sites, sink, "https://example.com/p/")
+    sitemap = (tmp_path / "out" / "sitemap.xml").read_text(encoding='utf-8')
+    assert "<loc>https://example.com/p/my%20site.html</loc>" in sitemap
+    assert 'href="my%20site.html"' in (tmp_path / "out" / "index.html").read_text(encoding='utf-8')
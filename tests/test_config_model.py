@@ -0,0 +1,26 @@
+import json
+import os
+import pickle
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir))
+
+from nigga import Portfolio, PortfolioGenerator  # noqa: E402
+
+
+def test_round_trip_keeps_values_and_key_order():
+    config = PortfolioGenerator().get_default_config()
+    shuffled = dict(reversed(list(config.items())))
+    shuffled["custom"] = {"nested": [1, {"a": None}]}
+    shuffled["projects"] = [dict(reversed(list(project.items()))) for project in config["projects"]]
+    del shuffled["languages"]
+
+    model = Portfolio.from_dict(shuffled)
+
+    assert json.dumps(model.to_dict()) == json.dumps(shuffled)
+    assert pickle.loads(pickle.dumps(model)) == model
+
+
+def test_generator_from_model_renders_the_same_page():
+    generator = PortfolioGenerator()
+    assert PortfolioGenerator.from_model(generator.to_model()).generate_html() == generator.generate_html()
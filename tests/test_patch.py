@@ -0,0 +1,95 @@
+import json
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir))
+
+from nigga import (  # noqa: E402
+    apply_json_patch,
+    apply_merge_patch,
+    matches_selector,
+    parse_selector,
+    patch_configs,
+    validate_patch,
+)
+
+
+DOC = {"a": {"b": [1, 2]}, "c": "x", "e~/f": 1}
+
+
+def test_json_patch_operations():
+    patched = apply_json_patch(DOC, [
+        {"op": "add", "path": "/a/b/-", "value": 3},
+        {"op": "add", "path": "/a/b/0", "value": 0},
+        {"op": "remove", "path": "/a/b/1"},
+        {"op": "copy", "from": "/c", "path": "/d"},
+        {"op": "move", "from": "/c", "path": "/g"},
+        {"op": "test", "path": "/e~0~1f", "value": 1},
+    ])
+    assert patched == {"a": {"b": [0, 2, 3]}, "e~/f": 1, "d": "x", "g": "x"}
+    assert DOC == {"a": {"b": [1, 2]}, "c": "x", "e~/f": 1}
+
+
+def test_json_patch_replace_keeps_key_position():
+    doc = {"theme": "dark", "primary_color": "#000", "accent_color": "#111"}
+    patched = apply_json_patch(doc, [{"op": "replace", "path": "/primary_color", "value": "#FFF"}])
+    assert list(patched) == ["theme", "primary_color", "accent_color"]
+    assert patched["primary_color"] == "#FFF"
+
+
+def test_json_patch_replace_in_array_and_missing_target():
+    assert apply_json_patch([1, 2, 3], [{"op": "replace", "path": "/1", "value": 9}]) == [1, 9, 3]
+    with pytest.raises(ValueError):
+        apply_json_patch(DOC, [{"op": "replace", "path": "/missing", "value": 1}])
+
+
+def test_json_patch_failed_test_raises():
+    with pytest.raises(ValueError):
+        apply_json_patch(DOC, [{"op": "test", "path": "/c", "value": "y"}])
+
+
+def test_merge_patch_deletes_nulls_and_leaves_target_untouched():
+    patched = apply_merge_patch(DOC, {"a": {"b": None, "z": 1}, "c": None})
+    assert patched == {"a": {"z": 1}, "e~/f": 1}
+    assert DOC["a"] == {"b": [1, 2]}
+
+
+@pytest.mark.parametrize("patch", [[1], [{"op": "nope", "path": "/a"}], [{"op": "add", "path": "/a"}],
+                                   [{"op": "add", "path": "a", "value": 1}], "text"])
+def test_validate_patch_rejects_malformed_patches(patch):
+    with pytest.raises(ValueError):
+        validate_patch(patch)
+
+
+def test_selector_parsing_and_matching():
+    where = parse_selector(["/style/theme=dark", "/count=3"])
+    assert where == {"/style/theme": "dark", "/count": 3}
+    assert matches_selector({"style": {"theme": "dark"}, "count": 3}, where)
+    assert not matches_selector({"style": {"theme": "light"}, "count": 3}, where)
+    with pytest.raises(ValueError):
+        parse_selector(["style/theme=dark"])
+
+
+def write_config(path, config):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(config, f, indent=2)
+    return str(path)
+
+
+def test_patch_configs_rewrites_only_changed_files(tmp_path):
+    dark = write_config(tmp_path / "dark.json", {"style": {"theme": "dark", "primary_color": "#000"}})
+    light = write_config(tmp_path / "light.json", {"style": {"theme": "light", "primary_color": "#000"}})
+    done = write_config(tmp_path / "done.json", {"style": {"theme": "dark", "primary_color": "#FFF"}})
+    before = {path: os.stat(path).st_mtime_ns for path in (light, done)}
+    patch = {"style": {"primary_color": "#FFF"}}
+
+    assert patch_configs([dark, light, done], patch, {"/style/theme": "dark"}, dry_run=True) == [dark]
+    with open(dark, encoding='utf-8') as f:
+        assert json.load(f)["style"]["primary_color"] == "#000"
+
+    assert patch_configs([dark, light, done], patch, {"/style/theme": "dark"}) == [dark]
+    with open(dark, encoding='utf-8') as f:
+        assert json.load(f)["style"]["primary_color"] == "#FFF"
+    assert {path: os.stat(path).st_mtime_ns for path in (light, done)} == before
@@ -0,0 +1,36 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir))
+
+import nigga  # noqa: E402
+from nigga import HTML_SECTIONS, PortfolioGenerator, profile_site  # noqa: E402
+
+
+def test_html_is_profiled_per_section():
+    report = profile_site(top=3)
+
+    html_stages = [name for name in report["stages"] if name.startswith("html")]
+    assert html_stages == [f"html:{name}" for name in HTML_SECTIONS] + ["html:page"]
+    for name in html_stages:
+        stage = report["stages"][name]
+        assert stage["top_retained"] and len(stage["top_retained"]) <= 3
+        assert stage["retained_bytes"] > 0
+    assert report["peak_bytes"] >= max(stage["peak_bytes"] for stage in report["stages"].values())
+
+
+def test_warm_up_runs_once_per_process(monkeypatch):
+    renders = []
+    original = PortfolioGenerator.generate_html
+
+    def counting_generate_html(self, sections=None):
+        renders.append(sections is None)
+        return original(self, sections)
+
+    monkeypatch.setattr(nigga, "_profile_warmed", False)
+    monkeypatch.setattr(PortfolioGenerator, "generate_html", counting_generate_html)
+    profile_site()
+    profile_site()
+
+    # One warm-up render, then only the assembled page for each site
+    assert renders == [True, False, False]
@@ -0,0 +1,48 @@
+import json
+import os
+import re
+import shutil
+import subprocess
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir))
+
+from nigga import PortfolioGenerator  # noqa: E402
+
+
+def run_page_search(html, queries):
+    """Run the page's own searchPortfolio() in node and return the hits per query"""
+    index = re.search(r'<script type="application/json" id="searchIndex">(.*?)</script>', html, re.S).group(1)
+    script = html[html.index('const searchTerms'):html.index("document.getElementById('portfolioSearch')")]
+    program = (
+        f"const searchIndex = {index};\n{script}\n"
+        f"const queries = {json.dumps(queries)};\n"
+        "console.log(JSON.stringify(queries.map(q => { const hits = searchPortfolio(q); "
+        "return hits === null ? null : [...hits].sort(); })));"
+    )
+    result = subprocess.run(["node", "-e", program], capture_output=True, text=True, check=True)
+    return dict(zip(queries, json.loads(result.stdout)))
+
+
+@pytest.mark.skipif(shutil.which("node") is None, reason="node is not installed")
+def test_page_search_matches_index():
+    hits = run_page_search(PortfolioGenerator().generate_html(), [
+        "redis", "vue. fast", "python and javascript", "devops & cloud", "the", "", "nosuchterm",
+    ])
+    assert hits["redis"] == ["project-1", "skills-2"]
+    assert hits["vue. fast"] == ["project-1", "skills-1"]
+    assert hits["python and javascript"] == ["project-2", "skills-0"]
+    assert hits["devops & cloud"] == ["skills-3"]
+    assert hits["the"] is None
+    assert hits[""] is None
+    assert hits["nosuchterm"] == []
+
+
+def test_page_index_has_no_config_hash():
+    generator = PortfolioGenerator()
+    html = generator.generate_html()
+    index = json.loads(re.search(r'id="searchIndex">(.*?)</script>', html, re.S).group(1))
+    assert "hash" not in index
+    assert generator.search_index_file()["hash"] == generator.config_hash()
@@ -0,0 +1,51 @@
+import json
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir))
+
+from nigga import PortfolioGenerator, diff_snapshots, write_snapshot  # noqa: E402
+
+
+def write_config(path, config=None):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(config or PortfolioGenerator().get_default_config(), f)
+    return str(path)
+
+
+def load(path):
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def test_snapshot_keys_do_not_depend_on_path_spelling(tmp_path, monkeypatch):
+    write_config(tmp_path / "s0_config.json")
+    monkeypatch.chdir(tmp_path)
+    write_snapshot(["s0_config.json"], "a.json")
+    write_snapshot([os.path.join(".", "s0_config.json")], "b.json")
+    write_snapshot([str(tmp_path / "s0_config.json")], "c.json")
+
+    assert list(load("a.json")["sites"]) == ["s0"]
+    assert diff_snapshots(load("a.json"), load("b.json")) == {"added": [], "removed": [], "changed": {}}
+    assert diff_snapshots(load("a.json"), load("c.json")) == {"added": [], "removed": [], "changed": {}}
+
+
+def test_snapshot_reports_changed_sections(tmp_path):
+    config = PortfolioGenerator().get_default_config()
+    path = write_config(tmp_path / "s0_config.json", config)
+    write_snapshot([path], str(tmp_path / "a.json"))
+    config["projects"][0]["name"] = "Renamed"
+    write_config(path, config)
+    write_snapshot([path], str(tmp_path / "b.json"))
+
+    report = diff_snapshots(load(tmp_path / "a.json"), load(tmp_path / "b.json"))
+    assert report["changed"] == {"s0": ["projects", "script"]}
+
+
+def test_snapshot_rejects_duplicate_site_names(tmp_path):
+    configs = [write_config(tmp_path / "a" / "x_config.json"), write_config(tmp_path / "b" / "x_config.json")]
+    with pytest.raises(ValueError):
+        write_snapshot(configs, str(tmp_path / "snap.json"))
@@ -0,0 +1,61 @@
+import os
+import re
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir))
+
+from nigga import BASE_CSS, PortfolioGenerator  # noqa: E402
+
+
+def palette_blocks(generator):
+    """Return {selector: {variable: value}} for the theme blocks of the generated CSS"""
+    css = generator.generate_css()
+    return {
+        selector.strip(): dict(re.findall(r'--([\w-]+): ([^;]+);', body))
+        for selector, body in re.findall(r'(:root[^{]*)\{([^}]*)\}', css)
+    }
+
+
+def test_every_variable_the_stylesheet_reads_is_defined():
+    used = set(re.findall(r'var\(--([\w-]+)\)', BASE_CSS))
+    for palette in palette_blocks(PortfolioGenerator()).values():
+        assert used <= set(palette)
+
+
+def test_default_colors_keep_white_text_and_secondary_link_hover():
+    for palette in palette_blocks(PortfolioGenerator()).values():
+        assert palette["primary-contrast"] == "white"
+        assert palette["accent-contrast"] == "white"
+    hover_rule = re.search(r'\.project-link:hover \{([^}]*)\}', BASE_CSS).group(1)
+    assert "background: var(--secondary);" in hover_rule
+
+
+def test_brand_override_drives_derived_shades_in_both_theme_blocks():
+    generator = PortfolioGenerator()
+    generator.config["style"]["colors"] = {"primary": "#FFFF00"}
+    blocks = palette_blocks(generator)
+    assert len(blocks) == 2
+    hovers = set()
+    for palette in blocks.values():
+        assert palette["primary"] == "#FFFF00"
+        assert palette["primary-contrast"] == "black"
+        hovers.add(palette["primary-hover"])
+    assert hovers == {"#FFFF26", "#D9D900"}
+
+
+def test_non_brand_override_only_applies_to_site_theme():
+    generator = PortfolioGenerator()
+    generator.config["style"]["colors"] = {"bg_color": "#111111"}
+    site, toggle = palette_blocks(generator).values()
+    assert site["bg-color"] == "#111111"
+    assert toggle["bg-color"] == "#FFFFFF"
+
+
+@pytest.mark.parametrize("colors", [{"bg_color": ["#000"]}, {"no_such_color": "#000"}, ["#000"]])
+def test_invalid_color_overrides_raise_value_error(colors):
+    generator = PortfolioGenerator()
+    generator.config["style"]["colors"] = colors
+    with pytest.raises(ValueError):
+        generator.generate_css()